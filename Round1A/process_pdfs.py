@@ -8,10 +8,164 @@ import os
 import json
 import time
 import fitz
+import heapq
+import numpy as np
 import re
-from collections import defaultdict, Counter
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import Dict, List, Tuple, Optional
-import statistics
+
+try:
+    import orjson  # C serializer, much faster than stdlib json
+except ImportError:
+    orjson = None
+
+# Cheaper glyph metrics during text extraction; line content and span sizes
+# are unaffected and bboxes are not used here
+fitz.TOOLS.set_small_glyph_heights(True)
+
+# Precompiled patterns for the per-element scoring hot paths
+_RE_NUM_DOT_NUM = re.compile(r'^\d+\.\d+\.?\s+')
+_RE_NUM_DOT = re.compile(r'^\d+\.?\s+')
+_RE_NUM_PREFIX = re.compile(r'^\d+\.')
+_RE_ALPHA = re.compile(r'^[A-Z]\.?\s+')
+_RE_CHAPTER = re.compile(r'^(Chapter|Section|Part)\s+\d+', re.I)
+_RE_CHAPTER_PART = re.compile(r'^(Chapter|Part)\s+\d+', re.I)
+_RE_SECTION = re.compile(r'^Section\s+\d+', re.I)
+_RE_MULTILEVEL = re.compile(r'^\d+\.\d+')
+_RE_APPENDIX = re.compile(r'^(Appendix|Abstract|Introduction|Conclusion)', re.I)
+_RE_WS = re.compile(r'\s+')
+
+# Section names promoted straight to H1
+_TITLE_WORDS = frozenset({'abstract', 'introduction', 'conclusion', 'references'})
+
+@dataclass
+class TextElements:
+    """Structure-of-arrays layout for extracted text lines.
+
+    Parallel arrays keep the numeric fields contiguous so document-wide
+    statistics and filters run as array operations instead of per-dict
+    lookups.
+    """
+    texts: List[str]          # already stripped
+    pages: np.ndarray         # int32
+    max_sizes: np.ndarray     # float32
+    is_bold: np.ndarray       # bool
+    is_italic: np.ndarray     # bool
+    word_counts: np.ndarray   # int32
+    is_upper: np.ndarray      # bool
+    is_title: np.ndarray      # bool
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+@lru_cache(maxsize=4096)
+def _content_score_cached(text: str, word_count: int, is_upper: bool, is_title: bool) -> float:
+    """Cached content quality score for repeated text (headers, footers)"""
+    score = 0.0
+
+    # Length scoring
+    if 3 <= word_count <= 20:
+        score += 0.5
+    elif word_count <= 30:
+        score += 0.3
+
+    # Pattern scoring
+    if is_title:
+        score += 0.2
+    elif is_upper and word_count <= 12:
+        score += 0.3
+
+    # Avoid non-title patterns
+    if _RE_NUM_PREFIX.match(text) or text.lower().startswith(('page ', 'figure ')):
+        score -= 0.5
+
+    return max(0, score)
+
+def _size_style_scores(max_sizes: np.ndarray, is_bold: np.ndarray, dominant_size: float) -> np.ndarray:
+    """Vectorized size-ratio and bold contributions of the heading score.
+
+    Runs the bucketed numeric arithmetic over the whole element array in C;
+    the text-dependent part is added per element by _text_heading_score_cached.
+    """
+    ratios = max_sizes.astype(np.float64) / dominant_size
+    scores = np.select(
+        [ratios >= 2.0, ratios >= 1.8, ratios >= 1.5,
+         ratios >= 1.3, ratios >= 1.2, ratios >= 1.1],
+        [0.5, 0.45, 0.4, 0.3, 0.2, 0.1],
+        default=0.0
+    )
+    scores[is_bold] += 0.25
+    return scores
+
+@lru_cache(maxsize=8192)
+def _heading_score_cached(base: float, text: str, word_count: int, is_upper: bool, is_title: bool) -> float:
+    """Cached text-dependent part of the heading score.
+
+    Takes the precomputed size/style base so the additions happen in the
+    same order as the original scalar code, keeping scores bit-identical.
+    The base only takes a handful of distinct values per document, so the
+    cache still collapses repeated headers and footers.
+    """
+    score = base
+
+    # Pattern factors
+    if _RE_NUM_DOT_NUM.match(text):  # 1.1, 2.3, etc.
+        score += 0.3
+    elif _RE_NUM_DOT.match(text):  # 1., 2., etc.
+        score += 0.25
+    elif _RE_ALPHA.match(text):  # A., B., etc.
+        score += 0.2
+    elif _RE_CHAPTER.match(text):
+        score += 0.35
+    elif _RE_APPENDIX.match(text):
+        score += 0.3
+
+    # Case patterns
+    if is_upper and 2 <= word_count <= 8:
+        score += 0.2
+    elif is_title and 2 <= word_count <= 12:
+        score += 0.15
+
+    # Length considerations
+    if 1 <= word_count <= 15:
+        score += 0.1
+    elif word_count > 25:
+        score -= 0.3
+
+    # Punctuation
+    if text.endswith(':'):
+        score += 0.15
+    elif text.endswith('.') and word_count > 10:
+        score -= 0.2
+
+    return min(score, 1.0)
+
+# Background writer so disk writes overlap with CPU work on the next document;
+# threads are joined at interpreter exit, so no write is lost
+_write_pool = ThreadPoolExecutor(max_workers=2)
+
+def _write_bytes(output_path: str, data: bytes):
+    """Write serialized bytes to disk (runs on the writer pool)"""
+    with open(output_path, 'wb') as f:
+        f.write(data)
+
+def _process_one(input_path: str, output_path: str) -> float:
+    """Process a single PDF in a worker process and return elapsed seconds"""
+    extractor = PDFStructureExtractor()
+    file_start = time.time()
+
+    try:
+        result = extractor.extract_document_structure(input_path)
+        extractor.save_json_result(result, output_path)
+    except Exception as e:
+        print(f"Error processing {os.path.basename(input_path)}: {e}")
+        fallback = {"title": "Document", "outline": []}
+        extractor.save_json_result(fallback, output_path)
+
+    return time.time() - file_start
 
 class PDFStructureExtractor:
     """Extracts structured outlines from PDF documents"""
@@ -21,49 +175,60 @@ class PDFStructureExtractor:
         
     def process_all_pdfs(self, input_dir: str, output_dir: str):
         """Process all PDF files in input directory"""
-        pdf_files = [f for f in os.listdir(input_dir) if f.endswith('.pdf')]
-        
-        print(f"Processing {len(pdf_files)} PDF documents")
+        pdf_entries = [e for e in os.scandir(input_dir) if e.name.endswith('.pdf')]
+
+        print(f"Processing {len(pdf_entries)} PDF documents")
         start_time = time.time()
-        
-        for pdf_file in pdf_files:
-            file_start = time.time()
-            input_path = os.path.join(input_dir, pdf_file)
-            output_file = pdf_file.replace('.pdf', '.json')
-            output_path = os.path.join(output_dir, output_file)
-            
-            try:
-                result = self.extract_document_structure(input_path)
-                self.save_json_result(result, output_path)
-                
-                file_time = time.time() - file_start
+
+        # Each PDF is independent and CPU-bound, so fan out across cores
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            futures = {}
+            for entry in pdf_entries:
+                output_file = entry.name.replace('.pdf', '.json')
+                output_path = os.path.join(output_dir, output_file)
+                future = executor.submit(_process_one, entry.path, output_path)
+                futures[future] = (entry.name, output_file)
+
+            for future in as_completed(futures):
+                pdf_file, output_file = futures[future]
+                file_time = future.result()
                 print(f"Processed {pdf_file} -> {output_file} ({file_time:.2f}s)")
-                
-            except Exception as e:
-                print(f"Error processing {pdf_file}: {e}")
-                fallback = {"title": "Document", "outline": []}
-                self.save_json_result(fallback, output_path)
-        
+
         total_time = time.time() - start_time
-        print(f"Completed processing {len(pdf_files)} documents in {total_time:.2f}s")
+        print(f"Completed processing {len(pdf_entries)} documents in {total_time:.2f}s")
 
     def extract_document_structure(self, pdf_path: str) -> Dict:
         """Extract structured outline from PDF document"""
         doc = fitz.open(pdf_path)
-        
+
         try:
-            # Extract text with formatting information
-            text_elements = self.extract_formatted_text(doc)
-            
+            # Single extraction pass: keep the slim per-page batches (parallel
+            # arrays, far smaller than the raw text dicts) and reuse them for
+            # statistics, title and outline instead of re-running get_text
+            page_batches = [batch for _, batch in self.iter_formatted_text(doc)]
+
+            all_sizes = (np.concatenate([batch.max_sizes for batch in page_batches])
+                         if page_batches else np.empty(0, dtype=np.float32))
+
             # Analyze document characteristics
-            doc_stats = self.analyze_document_statistics(text_elements)
-            
+            doc_stats = self.analyze_document_statistics(all_sizes)
+
             # Extract document title
-            title = self.extract_document_title(text_elements, doc_stats)
-            
-            # Extract hierarchical outline
-            outline = self.extract_document_outline(text_elements, doc_stats)
-            
+            first_page_elements = page_batches[0] if page_batches else None
+            title = self.extract_document_title(first_page_elements, doc_stats)
+
+            # Score headings one page batch at a time
+            outline = []
+            for page_elements in page_batches:
+                outline.extend(self.extract_document_outline(page_elements, doc_stats))
+
+            # Post-process for quality
+            outline = self.post_process_outline(outline)
+
+            # Remove confidence scores
+            for item in outline:
+                item.pop("confidence", None)
+
             return {
                 "title": title,
                 "outline": outline
@@ -71,67 +236,93 @@ class PDFStructureExtractor:
         finally:
             doc.close()
 
-    def extract_formatted_text(self, doc) -> List[Dict]:
-        """Extract text elements with formatting information"""
-        text_elements = []
-        
-        for page_num in range(len(doc)):
-            page = doc[page_num]
-            blocks = page.get_text("dict")
-            
+    def iter_formatted_text(self, doc):
+        """Yield (page_num, TextElements) for each page lazily"""
+        # Only text is needed; skip image block extraction entirely
+        text_flags = fitz.TEXT_PRESERVE_LIGATURES | fitz.TEXT_PRESERVE_WHITESPACE
+
+        # Iterating the document avoids re-resolving pages via __getitem__;
+        # sort=False skips MuPDF's reading-order block sort, which is unused
+        for page_num, page in enumerate(doc):
+            blocks = page.get_text("dict", flags=text_flags, sort=False)
+
+            texts = []
+            max_sizes = []
+            bold_flags = []
+            italic_flags = []
+            word_counts = []
+            upper_flags = []
+            title_flags = []
+
             for block in blocks.get("blocks", []):
                 if "lines" in block:
                     for line in block["lines"]:
                         line_text = ""
-                        font_sizes = []
-                        style_flags = []
-                        
+                        size_max = 0.0
+                        size_count = 0
+                        flag_or = 0
+
                         for span in line["spans"]:
                             text = span.get("text", "").strip()
                             if text:
                                 line_text += text + " "
-                                font_sizes.append(span.get("size", 12))
-                                style_flags.append(span.get("flags", 0))
-                        
-                        if line_text.strip():
-                            text_elements.append({
-                                "text": line_text.strip(),
-                                "page": page_num,
-                                "avg_size": statistics.mean(font_sizes) if font_sizes else 12,
-                                "max_size": max(font_sizes) if font_sizes else 12,
-                                "is_bold": any(flag & 2**4 for flag in style_flags),
-                                "is_italic": any(flag & 2**6 for flag in style_flags),
-                                "bbox": line.get("bbox", [0, 0, 0, 0])
-                            })
-        
-        return text_elements
+                                size = span.get("size", 12)
+                                if size > size_max:
+                                    size_max = size
+                                size_count += 1
+                                flag_or |= span.get("flags", 0)
+
+                        stripped = line_text.strip()
+                        if stripped:
+                            texts.append(stripped)
+                            max_sizes.append(size_max if size_count else 12)
+                            bold_flags.append(bool(flag_or & 16))
+                            italic_flags.append(bool(flag_or & 64))
+                            word_counts.append(len(stripped.split()))
+                            upper_flags.append(stripped.isupper())
+                            title_flags.append(stripped.istitle())
+
+            # Drop the heavy text dict and the page reference before yielding
+            # so native memory is released while the consumer runs
+            del blocks
+            page = None
 
-    def analyze_document_statistics(self, text_elements: List[Dict]) -> Dict:
+            yield page_num, TextElements(
+                texts=texts,
+                pages=np.full(len(texts), page_num, dtype=np.int32),
+                max_sizes=np.array(max_sizes, dtype=np.float32),
+                is_bold=np.array(bold_flags, dtype=bool),
+                is_italic=np.array(italic_flags, dtype=bool),
+                word_counts=np.array(word_counts, dtype=np.int32),
+                is_upper=np.array(upper_flags, dtype=bool),
+                is_title=np.array(title_flags, dtype=bool)
+            )
+
+    def analyze_document_statistics(self, font_sizes: np.ndarray) -> Dict:
         """Analyze document-wide statistics for intelligent processing"""
-        if not text_elements:
+        if not len(font_sizes):
             return {"dominant_size": 12, "size_thresholds": {"h1": 18, "h2": 15, "h3": 13}}
-        
-        # Font size analysis
-        font_sizes = [elem["max_size"] for elem in text_elements]
-        size_counter = Counter(font_sizes)
-        dominant_size = size_counter.most_common(1)[0][0]
-        
+
+        # Font size analysis: one C pass over the contiguous size array
+        size_values, size_counts = np.unique(font_sizes, return_counts=True)
+        dominant_size = float(size_values[size_counts.argmax()])
+
         # Calculate adaptive thresholds
-        unique_sizes = sorted(set(font_sizes), reverse=True)
-        
+        unique_sizes = size_values[::-1]  # descending
+
         if len(unique_sizes) >= 3:
-            h1_threshold = unique_sizes[0]
-            h2_threshold = unique_sizes[1] if len(unique_sizes) > 1 else dominant_size * 1.3
-            h3_threshold = unique_sizes[2] if len(unique_sizes) > 2 else dominant_size * 1.1
+            h1_threshold = float(unique_sizes[0])
+            h2_threshold = float(unique_sizes[1])
+            h3_threshold = float(unique_sizes[2])
         else:
-            h1_threshold = max(dominant_size * 1.5, max(font_sizes) * 0.9)
+            h1_threshold = max(dominant_size * 1.5, float(unique_sizes[0]) * 0.9)
             h2_threshold = dominant_size * 1.3
             h3_threshold = dominant_size * 1.1
-        
+
         return {
             "dominant_size": dominant_size,
             "all_sizes": font_sizes,
-            "size_distribution": dict(size_counter),
+            "size_distribution": dict(zip(size_values.tolist(), size_counts.tolist())),
             "size_thresholds": {
                 "h1": h1_threshold,
                 "h2": h2_threshold,
@@ -139,43 +330,48 @@ class PDFStructureExtractor:
             }
         }
 
-    def extract_document_title(self, text_elements: List[Dict], doc_stats: Dict) -> str:
+    def extract_document_title(self, first_page_elements: Optional[TextElements], doc_stats: Dict) -> str:
         """Extract document title using multi-factor analysis"""
-        if not text_elements:
+        if first_page_elements is None or not len(first_page_elements):
             return "Document"
-        
+
         # Focus on first page elements
-        first_page_elements = [elem for elem in text_elements if elem["page"] == 0][:15]
-        
+        candidate_count = min(len(first_page_elements), 15)
+        dominant_size = doc_stats["dominant_size"]
+
         title_candidates = []
-        
-        for i, elem in enumerate(first_page_elements):
-            text = elem["text"].strip()
+
+        for i in range(candidate_count):
+            text = first_page_elements.texts[i]
             if not text or len(text) < 3:
                 continue
-            
+
             # Calculate title score using multiple factors
-            size_score = self.calculate_size_score(elem, doc_stats)
+            size_score = self.calculate_size_score(float(first_page_elements.max_sizes[i]), dominant_size)
             position_score = self.calculate_position_score(i)
-            content_score = self.calculate_content_score(text)
-            style_score = self.calculate_style_score(elem)
-            
+            content_score = self.calculate_content_score(
+                text, int(first_page_elements.word_counts[i]),
+                bool(first_page_elements.is_upper[i]), bool(first_page_elements.is_title[i])
+            )
+            style_score = self.calculate_style_score(
+                bool(first_page_elements.is_bold[i]), bool(first_page_elements.is_italic[i])
+            )
+
             # Weighted combination
-            total_score = (size_score * 0.4 + position_score * 0.2 + 
+            total_score = (size_score * 0.4 + position_score * 0.2 +
                           content_score * 0.2 + style_score * 0.2)
-            
+
             title_candidates.append((total_score, text))
         
         if title_candidates:
-            title_candidates.sort(key=lambda x: x[0], reverse=True)
-            best_title = title_candidates[0][1]
+            best_title = max(title_candidates, key=lambda x: x[0])[1]
             return self.clean_title(best_title)
         
         return "Document"
 
-    def calculate_size_score(self, elem: Dict, doc_stats: Dict) -> float:
+    def calculate_size_score(self, max_size: float, dominant_size: float) -> float:
         """Calculate size-based score"""
-        size_ratio = elem["max_size"] / doc_stats["dominant_size"]
+        size_ratio = max_size / dominant_size
         
         if size_ratio >= 2.5:
             return 1.0
@@ -201,158 +397,97 @@ class PDFStructureExtractor:
         else:
             return 0.3
 
-    def calculate_content_score(self, text: str) -> float:
+    def calculate_content_score(self, text: str, word_count: int, is_upper: bool, is_title: bool) -> float:
         """Calculate content quality score"""
-        word_count = len(text.split())
-        score = 0.0
-        
-        # Length scoring
-        if 3 <= word_count <= 20:
-            score += 0.5
-        elif word_count <= 30:
-            score += 0.3
-        
-        # Pattern scoring
-        if text.istitle():
-            score += 0.2
-        elif text.isupper() and word_count <= 12:
-            score += 0.3
-        
-        # Avoid non-title patterns
-        if re.match(r'^\d+\.', text) or text.lower().startswith(('page ', 'figure ')):
-            score -= 0.5
-        
-        return max(0, score)
+        return _content_score_cached(text, word_count, is_upper, is_title)
 
-    def calculate_style_score(self, elem: Dict) -> float:
+    def calculate_style_score(self, is_bold: bool, is_italic: bool) -> float:
         """Calculate style-based score"""
         score = 0.0
-        if elem["is_bold"]:
+        if is_bold:
             score += 0.6
-        if elem["is_italic"]:
+        if is_italic:
             score += 0.2
         return score
 
     def clean_title(self, title: str) -> str:
         """Clean and format title"""
-        title = re.sub(r'\s+', ' ', title).strip()
+        title = _RE_WS.sub(' ', title).strip()
         if len(title) > 100:
             words = title[:100].split()
             if len(words) > 1:
                 title = ' '.join(words[:-1])
         return title if len(title) >= 3 else "Document"
 
-    def extract_document_outline(self, text_elements: List[Dict], doc_stats: Dict) -> List[Dict]:
-        """Extract hierarchical document outline"""
+    def extract_document_outline(self, text_elements: TextElements, doc_stats: Dict) -> List[Dict]:
+        """Score one batch of elements and return raw outline entries"""
         outline = []
         thresholds = doc_stats["size_thresholds"]
-        
-        for elem in text_elements:
-            text = elem["text"].strip()
+        h1_threshold = thresholds["h1"]
+        h2_threshold = thresholds["h2"]
+        dominant_size = doc_stats["dominant_size"]
+
+        texts = text_elements.texts
+        pages = text_elements.pages
+        max_sizes = text_elements.max_sizes
+        word_counts = text_elements.word_counts
+        is_upper = text_elements.is_upper
+        is_title = text_elements.is_title
+
+        # Numeric score contributions for all elements in one vectorized pass
+        base_scores = _size_style_scores(max_sizes, text_elements.is_bold, dominant_size)
+
+        # Pre-filter: body text at the dominant size with many words can never
+        # reach the 0.7 threshold (text terms alone top out at 0.5), so skip
+        # the regex scoring for it entirely
+        skip = (base_scores == 0.0) & (word_counts > 15)
+
+        for i in range(len(texts)):
+            if skip[i]:
+                continue
+
+            text = texts[i]
             if not text or len(text) < 2:
                 continue
-            
+
             # Calculate heading score
-            heading_score = self.calculate_heading_score(elem, doc_stats)
-            
+            heading_score = _heading_score_cached(
+                float(base_scores[i]), text, int(word_counts[i]),
+                bool(is_upper[i]), bool(is_title[i])
+            )
+
             if heading_score >= 0.7:  # High precision threshold
-                level = self.determine_heading_level(elem, thresholds, text)
-                
+                level = self.determine_heading_level(float(max_sizes[i]), h1_threshold, h2_threshold, text)
+
                 outline.append({
                     "level": level,
                     "text": text,
-                    "page": elem["page"],
+                    "page": int(pages[i]),
                     "confidence": heading_score
                 })
-        
-        # Post-process for quality
-        outline = self.post_process_outline(outline)
-        
-        # Remove confidence scores
-        for item in outline:
-            item.pop("confidence", None)
-        
-        return outline
 
-    def calculate_heading_score(self, elem: Dict, doc_stats: Dict) -> float:
-        """Calculate heading detection score"""
-        text = elem["text"].strip()
-        score = 0.0
-        
-        # Font size factor
-        size_ratio = elem["max_size"] / doc_stats["dominant_size"]
-        if size_ratio >= 2.0:
-            score += 0.5
-        elif size_ratio >= 1.8:
-            score += 0.45
-        elif size_ratio >= 1.5:
-            score += 0.4
-        elif size_ratio >= 1.3:
-            score += 0.3
-        elif size_ratio >= 1.2:
-            score += 0.2
-        elif size_ratio >= 1.1:
-            score += 0.1
-        
-        # Style factors
-        if elem["is_bold"]:
-            score += 0.25
-        
-        # Pattern factors
-        if re.match(r'^\d+\.\d+\.?\s+', text):  # 1.1, 2.3, etc.
-            score += 0.3
-        elif re.match(r'^\d+\.?\s+', text):  # 1., 2., etc.
-            score += 0.25
-        elif re.match(r'^[A-Z]\.?\s+', text):  # A., B., etc.
-            score += 0.2
-        elif re.match(r'^(Chapter|Section|Part)\s+\d+', text, re.I):
-            score += 0.35
-        elif re.match(r'^(Appendix|Abstract|Introduction|Conclusion)', text, re.I):
-            score += 0.3
-        
-        # Case patterns
-        word_count = len(text.split())
-        if text.isupper() and 2 <= word_count <= 8:
-            score += 0.2
-        elif text.istitle() and 2 <= word_count <= 12:
-            score += 0.15
-        
-        # Length considerations
-        if 1 <= word_count <= 15:
-            score += 0.1
-        elif word_count > 25:
-            score -= 0.3
-        
-        # Punctuation
-        if text.endswith(':'):
-            score += 0.15
-        elif text.endswith('.') and word_count > 10:
-            score -= 0.2
-        
-        return min(score, 1.0)
+        return outline
 
-    def determine_heading_level(self, elem: Dict, thresholds: Dict, text: str) -> str:
+    def determine_heading_level(self, size: float, h1_threshold: float, h2_threshold: float, text: str) -> str:
         """Determine heading level"""
-        size = elem["max_size"]
-        
         # Primary classification by size
-        if size >= thresholds["h1"]:
+        if size >= h1_threshold:
             base_level = "H1"
-        elif size >= thresholds["h2"]:
+        elif size >= h2_threshold:
             base_level = "H2"
         else:
             base_level = "H3"
         
         # Pattern-based adjustments
-        if re.match(r'^(Chapter|Part)\s+\d+', text, re.I):
+        if _RE_CHAPTER_PART.match(text):
             return "H1"
-        elif re.match(r'^Section\s+\d+', text, re.I):
+        elif _RE_SECTION.match(text):
             return "H2"
-        elif re.match(r'^\d+\.\d+', text):  # Multi-level numbering
+        elif _RE_MULTILEVEL.match(text):  # Multi-level numbering
             return "H3"
-        elif re.match(r'^\d+\.?\s+', text) and base_level != "H3":
+        elif _RE_NUM_DOT.match(text) and base_level != "H3":
             return "H2"
-        elif text.lower() in ['abstract', 'introduction', 'conclusion', 'references']:
+        elif text.lower() in _TITLE_WORDS:
             return "H1"
         
         return base_level
@@ -366,7 +501,7 @@ class PDFStructureExtractor:
         seen = set()
         unique_outline = []
         for item in outline:
-            key = (item["text"].lower().strip(), item["page"])
+            key = (item["text"].lower(), item["page"])
             if key not in seen:
                 seen.add(key)
                 unique_outline.append(item)
@@ -387,16 +522,18 @@ class PDFStructureExtractor:
         
         # Global limit
         if len(filtered_outline) > 20:
-            filtered_outline.sort(key=lambda x: x["confidence"], reverse=True)
-            filtered_outline = filtered_outline[:20]
+            filtered_outline = heapq.nlargest(20, filtered_outline, key=lambda x: x["confidence"])
             filtered_outline.sort(key=lambda x: x["page"])
         
         return filtered_outline
 
     def save_json_result(self, result: Dict, output_path: str):
-        """Save result to JSON file"""
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(result, f, indent=2, ensure_ascii=False)
+        """Serialize now, hand the disk write to the background pool"""
+        if orjson is not None:
+            data = orjson.dumps(result, option=orjson.OPT_INDENT_2)
+        else:
+            data = json.dumps(result, indent=2, ensure_ascii=False).encode('utf-8')
+        _write_pool.submit(_write_bytes, output_path, data)
 
 def main():
     """Main execution function"""
@@ -4,16 +4,152 @@ Round 1B: Persona-Driven Document Intelligence
 Connecting the Dots Challenge - Connect What Matters For the User Who Matters
 """
 
+import heapq
+import multiprocessing
 import os
 import json
 import time
 import fitz
+import numpy as np
 import re
-from collections import defaultdict, Counter
-from typing import Dict, List, Set
-import statistics
+from collections import defaultdict, namedtuple, Counter
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
+from typing import Dict, List, Optional, Set
 from datetime import datetime
 
+try:
+    import ahocorasick  # one-pass multi-keyword matching
+except ImportError:
+    ahocorasick = None
+
+try:
+    import orjson  # much faster JSON serialization when available
+except ImportError:
+    orjson = None
+
+# Precompiled patterns shared by the persona and scoring hot paths
+_EXPERTISE_COMPBIO = re.compile(r'computational biology|drug discovery', re.I)
+_EXPERTISE_FINANCE = re.compile(r'investment|financial|analyst', re.I)
+_EXPERTISE_CHEMISTRY = re.compile(r'chemistry|organic|student', re.I)
+_WORD_RE = re.compile(r'\b[a-zA-Z]{4,}\b')
+_ACTION_PATTERNS = tuple(re.compile(p, re.I) for p in
+                         [r'analyze?\s+(\w+)', r'identify\s+(\w+)', r'prepare\s+(\w+)'])
+# Single alternation so all heading shapes are tried in one engine pass
+_HEADING_UNION = re.compile(
+    r'^(?:\d+\.?\s+[A-Z]'
+    r'|[A-Z][A-Z\s]+$'
+    r'|(?:Chapter|Section|Abstract|Introduction|Conclusion|Methodology)$)', re.I)
+
+
+@lru_cache(maxsize=4096)
+def _heading_pattern_match(text: str) -> bool:
+    """Memoized heading-pattern check; repeated headers/footers hit the cache"""
+    return bool(_HEADING_UNION.match(text))
+# Numbers and statistical terms fused into one alternation so quantitative
+# scoring traverses the text once; digits and letters cannot overlap, so the
+# combined scan counts exactly what the two separate patterns did.
+_QUANT_UNION = re.compile(r'(?P<num>\b\d+(?:\.\d+)?%?\b)|(?P<stat>\b(?:mean|median|average|analysis)\b)', re.I)
+
+_COMMON_WORDS = frozenset({'the', 'and', 'for', 'are', 'but', 'not', 'you', 'all', 'can', 'had'})
+
+# Category alternations with named groups: one engine pass over the text
+# collects every matching category, then the priority order below decides.
+_PERSONA_CLASSIFIER = re.compile(
+    r"(?P<academic_researcher>researcher|phd|scientist|academic)"
+    r"|(?P<business_analyst>analyst|investment|financial|business)"
+    r"|(?P<student>student|undergraduate|graduate)"
+    r"|(?P<technical_professional>engineer|developer|technical)")
+_PERSONA_PRIORITY = ("academic_researcher", "business_analyst", "student", "technical_professional")
+
+_SECTION_CLASSIFIER = re.compile(
+    r"(?P<abstract>abstract|summary)"
+    r"|(?P<introduction>introduction|background)"
+    r"|(?P<methodology>methodology|methods)"
+    r"|(?P<results>results|findings)"
+    r"|(?P<discussion>discussion|analysis)"
+    r"|(?P<conclusion>conclusion)")
+_SECTION_PRIORITY = ("abstract", "introduction", "methodology", "results", "discussion", "conclusion")
+
+# Documents below this page count are parsed inline; the pool only pays off
+# once a single PDF has enough pages to split across cores
+_PAGE_PARALLEL_MIN = 50
+
+# refined_text truncation settings
+_REFINED_LIMIT = 500
+_ELLIPSIS = "..."
+
+# Only these three fields are read downstream; a namedtuple keeps the
+# intermediate representation small and pickles cheaply across workers
+Element = namedtuple("Element", "text avg_size is_bold")
+
+
+def _parse_page(page, page_num: int) -> Dict:
+    """Parse one page into its element list"""
+    # Text only; skips image block decoding entirely
+    blocks = page.get_text(
+        "dict", flags=fitz.TEXT_PRESERVE_LIGATURES | fitz.TEXT_PRESERVE_WHITESPACE)
+    page_elements = []
+
+    for block in blocks.get("blocks", []):
+        if "lines" in block:
+            for line in block["lines"]:
+                line_text = ""
+                size_sum = 0.0
+                size_count = 0
+                flag_or = 0
+
+                for span in line["spans"]:
+                    text = span.get("text", "").strip()
+                    if text:
+                        line_text += text + " "
+                        size_sum += span.get("size", 12)
+                        size_count += 1
+                        flag_or |= span.get("flags", 0)
+
+                if line_text.strip():
+                    page_elements.append(Element(
+                        text=line_text.strip(),
+                        avg_size=size_sum / size_count if size_count else 12,
+                        is_bold=bool(flag_or & 16)
+                    ))
+
+    return {
+        "page_num": page_num,
+        "elements": page_elements
+    }
+
+def _parse_page_range(pdf_path: str, start: int, end: int) -> List[Dict]:
+    """Parse pages [start, end) in a worker process.
+
+    The document is reopened inside the worker because fitz handles cannot
+    be shared across processes.
+    """
+    doc = fitz.open(pdf_path)
+    try:
+        return [_parse_page(doc[page_num], page_num) for page_num in range(start, end)]
+    finally:
+        doc.close()
+
+def _extract_one(doc_name: str, input_dir: str) -> Optional[Dict]:
+    """Extract a single PDF's content in a worker process"""
+    doc_path = os.path.join(input_dir, doc_name)
+    if not (os.path.exists(doc_path) and doc_name.endswith('.pdf')):
+        return None
+
+    try:
+        doc_content = PersonaDrivenAnalyzer().extract_pdf_content(doc_path)
+    except Exception as e:
+        print(f"Warning: Error extracting {doc_name}: {e}")
+        return None
+
+    print(f"Extracted content from {doc_name}")
+    return {
+        "name": doc_name,
+        "path": doc_path,
+        "content": doc_content
+    }
+
 class PersonaAnalyzer:
     """Analyzes persona and job requirements"""
     
@@ -34,37 +170,30 @@ class PersonaAnalyzer:
 
     def classify_persona_type(self, persona: str) -> str:
         """Classify persona into categories"""
-        persona_lower = persona.lower()
-        
-        if any(term in persona_lower for term in ['researcher', 'phd', 'scientist', 'academic']):
-            return "academic_researcher"
-        elif any(term in persona_lower for term in ['analyst', 'investment', 'financial', 'business']):
-            return "business_analyst"
-        elif any(term in persona_lower for term in ['student', 'undergraduate', 'graduate']):
-            return "student"
-        elif any(term in persona_lower for term in ['engineer', 'developer', 'technical']):
-            return "technical_professional"
-        else:
-            return "general_professional"
+        hits = {m.lastgroup for m in _PERSONA_CLASSIFIER.finditer(persona.lower())}
+        for category in _PERSONA_PRIORITY:
+            if category in hits:
+                return category
+        return "general_professional"
 
     def extract_expertise_areas(self, persona: str) -> List[str]:
         """Extract expertise keywords from persona"""
         expertise_keywords = []
         
         # Domain-specific extraction
-        if re.search(r'computational biology|drug discovery', persona, re.I):
+        if _EXPERTISE_COMPBIO.search(persona):
             expertise_keywords.extend(['computational', 'biology', 'drug', 'discovery', 'methodology', 'datasets'])
-        if re.search(r'investment|financial|analyst', persona, re.I):
+        if _EXPERTISE_FINANCE.search(persona):
             expertise_keywords.extend(['financial', 'investment', 'revenue', 'market', 'analysis'])
-        if re.search(r'chemistry|organic|student', persona, re.I):
+        if _EXPERTISE_CHEMISTRY.search(persona):
             expertise_keywords.extend(['chemistry', 'organic', 'reaction', 'kinetics', 'mechanisms'])
-        
+
         # General keyword extraction
-        words = re.findall(r'\b[a-zA-Z]{4,}\b', persona.lower())
-        common_words = {'the', 'and', 'for', 'are', 'but', 'not', 'you', 'all', 'can', 'had'}
-        expertise_keywords.extend([w for w in words if w not in common_words])
-        
-        return list(set(expertise_keywords))
+        words = _WORD_RE.findall(persona.lower())
+        expertise_keywords.extend([w for w in words if w not in _COMMON_WORDS])
+
+        # dict.fromkeys dedups while keeping extraction order deterministic
+        return list(dict.fromkeys(expertise_keywords))
 
     def analyze_job_priorities(self, job_description: str) -> List[str]:
         """Extract job priorities"""
@@ -78,13 +207,12 @@ class PersonaAnalyzer:
         if 'exam preparation' in job_lower:
             priorities.extend(['concepts', 'mechanisms', 'key', 'important'])
         
-        # Extract action keywords
-        action_patterns = [r'analyze?\s+(\w+)', r'identify\s+(\w+)', r'prepare\s+(\w+)']
-        for pattern in action_patterns:
-            matches = re.findall(pattern, job_description, re.I)
-            priorities.extend(matches)
-        
-        return list(set(priorities))
+        # Extract action keywords, lowercased so downstream matching never
+        # has to normalize them again
+        for pattern in _ACTION_PATTERNS:
+            priorities.extend(word.lower() for word in pattern.findall(job_description))
+
+        return list(dict.fromkeys(priorities))
 
     def infer_content_preferences(self, persona: str, job: str) -> Dict:
         """Infer content preferences"""
@@ -128,15 +256,28 @@ class PersonaAnalyzer:
 
 class DocumentProcessor:
     """Processes documents to extract sections"""
-    
+
+    def __init__(self):
+        # Structure analysis per document path; batch workflows score the
+        # same corpus against several personas, so reuse it across calls
+        self._structure_cache = {}
+
     def extract_document_sections(self, document: Dict) -> List[Dict]:
         """Extract sections from document"""
         sections = []
         doc_name = document["name"]
         pages_content = document["content"]["pages"]
-        
-        # Analyze document structure
-        doc_analysis = self.analyze_document_structure(pages_content)
+
+        # Analyze document structure (cached by path when available)
+        doc_path = document.get("path")
+        if doc_path is not None and doc_path in self._structure_cache:
+            doc_analysis = self._structure_cache[doc_path]
+        else:
+            doc_analysis = self.analyze_document_structure(pages_content)
+            if doc_path is not None:
+                if len(self._structure_cache) >= 64:
+                    self._structure_cache.clear()
+                self._structure_cache[doc_path] = doc_analysis
         
         # Extract sections
         current_section = None
@@ -145,20 +286,21 @@ class DocumentProcessor:
             page_num = page["page_num"]
             
             for elem in page["elements"]:
-                text = elem["text"].strip()
+                text = elem.text.strip()
                 if not text:
                     continue
                 
                 # Check if heading
                 if self.is_section_heading(elem, doc_analysis):
                     # Save previous section
-                    if current_section and current_section["content"].strip():
-                        sections.append(current_section)
-                    
-                    # Start new section
+                    if current_section and current_section["_frags"]:
+                        self.close_section(current_section, sections)
+
+                    # Start new section; content accumulates as fragments and
+                    # is joined once on close to avoid quadratic concatenation
                     current_section = {
                         "title": text,
-                        "content": "",
+                        "_frags": [],
                         "document": doc_name,
                         "page": page_num,
                         "section_type": self.classify_section_type(text)
@@ -166,75 +308,69 @@ class DocumentProcessor:
                 else:
                     # Add to current section
                     if current_section:
-                        current_section["content"] += text + " "
-        
+                        current_section["_frags"].append(text)
+
         # Add final section
-        if current_section and current_section["content"].strip():
-            sections.append(current_section)
-        
+        if current_section and current_section["_frags"]:
+            self.close_section(current_section, sections)
+
         return sections
 
+    def close_section(self, section: Dict, sections: List[Dict]):
+        """Join accumulated fragments into content and record the section"""
+        section["content"] = " ".join(section.pop("_frags"))
+        sections.append(section)
+
     def analyze_document_structure(self, pages_content: List[Dict]) -> Dict:
         """Analyze document structure"""
-        all_elements = []
-        for page in pages_content:
-            all_elements.extend(page["elements"])
-        
-        if not all_elements:
+        # One C histogram pass over a contiguous array; no flattened temp list
+        sizes = np.fromiter(
+            (elem.avg_size for page in pages_content for elem in page["elements"]),
+            dtype=np.float64
+        )
+
+        if sizes.size == 0:
             return {"primary_size": 12, "heading_threshold": 14}
-        
-        sizes = [elem["avg_size"] for elem in all_elements]
-        size_counter = Counter(sizes)
-        primary_size = size_counter.most_common(1)[0][0]
-        
+
+        size_values, size_counts = np.unique(sizes, return_counts=True)
+        primary_size = float(size_values[size_counts.argmax()])
+
         return {
             "primary_size": primary_size,
             "heading_threshold": primary_size * 1.2
         }
 
-    def is_section_heading(self, elem: Dict, doc_analysis: Dict) -> bool:
+    def is_section_heading(self, elem: Element, doc_analysis: Dict) -> bool:
         """Check if element is a heading"""
-        text = elem["text"].strip()
-        
+        text = elem.text.strip()
+
         # Size check
-        if elem["avg_size"] >= doc_analysis["heading_threshold"]:
+        if elem.avg_size >= doc_analysis["heading_threshold"]:
             return True
-        
+
+        # Cheap length gates: long text is body prose, no regex needed
+        if len(text) > 120:
+            return False
+
+        word_count = len(text.split())
+
         # Style check
-        if elem["is_bold"] and len(text.split()) <= 15:
+        if elem.is_bold and word_count <= 15:
             return True
-        
-        # Pattern check
-        patterns = [
-            r'^\d+\.?\s+[A-Z]',
-            r'^[A-Z][A-Z\s]+$',
-            r'^(Chapter|Section|Abstract|Introduction|Conclusion|Methodology)$'
-        ]
-        
-        for pattern in patterns:
-            if re.match(pattern, text, re.I):
-                return True
-        
-        return False
+
+        if word_count > 15:
+            return False
+
+        # Pattern check; memoized because headers/footers repeat verbatim
+        return _heading_pattern_match(text)
 
     def classify_section_type(self, text: str) -> str:
         """Classify section type"""
-        text_lower = text.lower()
-        
-        if any(term in text_lower for term in ['abstract', 'summary']):
-            return "abstract"
-        elif any(term in text_lower for term in ['introduction', 'background']):
-            return "introduction"
-        elif any(term in text_lower for term in ['methodology', 'methods']):
-            return "methodology"
-        elif any(term in text_lower for term in ['results', 'findings']):
-            return "results"
-        elif any(term in text_lower for term in ['discussion', 'analysis']):
-            return "discussion"
-        elif any(term in text_lower for term in ['conclusion']):
-            return "conclusion"
-        else:
-            return "general"
+        hits = {m.lastgroup for m in _SECTION_CLASSIFIER.finditer(text.lower())}
+        for category in _SECTION_PRIORITY:
+            if category in hits:
+                return category
+        return "general"
 
 
 class RelevanceScorer:
@@ -242,50 +378,92 @@ class RelevanceScorer:
     
     def score_sections(self, sections: List[Dict], persona_profile: Dict) -> List[Dict]:
         """Score all sections for relevance"""
-        scored_sections = []
-        
+        if not sections:
+            return []
+
+        keyword_automaton = self.build_keyword_automaton(persona_profile)
+
         for section in sections:
-            relevance_score = self.calculate_relevance_score(section, persona_profile)
-            
-            section_with_score = section.copy()
-            section_with_score["relevance_score"] = relevance_score
-            scored_sections.append(section_with_score)
-        
-        return scored_sections
+            # Derived fields computed once; every sub-scorer reads these
+            # instead of re-lowering and re-splitting the section text
+            section["_text_lower"] = (section["title"] + " " + section["content"]).lower()
+            section["_word_count"] = len(section["content"].split())
+
+        # Sub-scores as parallel arrays so the weighted aggregation runs
+        # as elementwise NumPy ops instead of per-section Python arithmetic
+        kw = np.array([self.calculate_keyword_score(s, persona_profile, keyword_automaton) for s in sections])
+        st = np.array([self.calculate_section_type_score(s, persona_profile) for s in sections])
+        cd = np.array([self.calculate_content_depth_score(s) for s in sections])
+        qt = np.array([self.calculate_quantitative_score(s) for s in sections])
+        ps = np.array([self.calculate_position_score(s) for s in sections])
 
-    def calculate_relevance_score(self, section: Dict, persona_profile: Dict) -> float:
-        """Calculate comprehensive relevance score"""
         weights = persona_profile["relevance_weights"]
-        
-        keyword_score = self.calculate_keyword_score(section, persona_profile)
-        section_type_score = self.calculate_section_type_score(section, persona_profile)
-        content_depth_score = self.calculate_content_depth_score(section)
-        quantitative_score = self.calculate_quantitative_score(section)
-        position_score = self.calculate_position_score(section)
-        
-        total_score = (
-            keyword_score * weights["keyword_match"] +
-            section_type_score * weights["section_type"] +
-            content_depth_score * weights["content_depth"] +
-            quantitative_score * weights["quantitative_content"] +
-            position_score * weights["position_importance"]
+        # Chained elementwise terms keep the scalar sum's float accumulation
+        # order, so scores stay bit-identical to the per-section loop
+        totals = np.minimum(
+            kw * weights["keyword_match"] +
+            st * weights["section_type"] +
+            cd * weights["content_depth"] +
+            qt * weights["quantitative_content"] +
+            ps * weights["position_importance"],
+            1.0
         )
-        
-        return min(total_score, 1.0)
 
-    def calculate_keyword_score(self, section: Dict, persona_profile: Dict) -> float:
+        scored_sections = []
+        for section, total in zip(sections, totals):
+            del section["_text_lower"], section["_word_count"]
+            section_with_score = section.copy()
+            section_with_score["relevance_score"] = float(total)
+            scored_sections.append(section_with_score)
+
+        return scored_sections
+
+    def build_keyword_automaton(self, persona_profile: Dict):
+        """Build an Aho-Corasick automaton over the persona's keyword set.
+
+        Each keyword carries how many expertise/priority entries it stands
+        for, so match counting stays identical to the substring loop.
+        Returns None when pyahocorasick isn't installed.
+        """
+        if ahocorasick is None:
+            return None
+
+        expertise_counts = Counter(persona_profile["expertise_areas"])
+        priority_counts = Counter(persona_profile["job_priorities"])
+        if not expertise_counts and not priority_counts:
+            return None
+
+        automaton = ahocorasick.Automaton()
+        for keyword in expertise_counts.keys() | priority_counts.keys():
+            automaton.add_word(keyword, (expertise_counts.get(keyword, 0),
+                                         priority_counts.get(keyword, 0),
+                                         keyword))
+        automaton.make_automaton()
+        return automaton
+
+    def calculate_keyword_score(self, section: Dict, persona_profile: Dict, keyword_automaton=None) -> float:
         """Calculate keyword matching score"""
         expertise_areas = persona_profile["expertise_areas"]
         job_priorities = persona_profile["job_priorities"]
-        
-        text = (section["title"] + " " + section["content"]).lower()
-        
-        expertise_matches = sum(1 for keyword in expertise_areas if keyword.lower() in text)
-        priority_matches = sum(1 for priority in job_priorities if priority.lower() in text)
-        
+
+        text = section["_text_lower"]
+
+        if keyword_automaton is not None:
+            # One automaton pass over the text instead of one scan per keyword
+            matched = {}
+            for _, (expertise_count, priority_count, keyword) in keyword_automaton.iter(text):
+                matched[keyword] = (expertise_count, priority_count)
+            expertise_matches = sum(e for e, _ in matched.values())
+            priority_matches = sum(p for _, p in matched.values())
+        else:
+            # Profile keyword lists are stored lowercased, so no per-section
+            # normalization is needed here
+            expertise_matches = sum(1 for keyword in expertise_areas if keyword in text)
+            priority_matches = sum(1 for priority in job_priorities if priority in text)
+
         expertise_score = min(expertise_matches / max(len(expertise_areas), 1), 1.0)
         priority_score = min(priority_matches / max(len(job_priorities), 1), 1.0)
-        
+
         return (expertise_score * 0.4 + priority_score * 0.6)
 
     def calculate_section_type_score(self, section: Dict, persona_profile: Dict) -> float:
@@ -311,7 +489,7 @@ class RelevanceScorer:
 
     def calculate_content_depth_score(self, section: Dict) -> float:
         """Calculate content depth score"""
-        word_count = len(section["content"].split())
+        word_count = section["_word_count"]
         
         if word_count < 50:
             return 0.3
@@ -324,11 +502,15 @@ class RelevanceScorer:
 
     def calculate_quantitative_score(self, section: Dict) -> float:
         """Calculate quantitative content score"""
-        content = section["title"] + " " + section["content"]
-        
-        numbers = len(re.findall(r'\b\d+(?:\.\d+)?%?\b', content))
-        statistical_terms = len(re.findall(r'\b(?:mean|median|average|analysis)\b', content, re.I))
+        content = section["_text_lower"]
         
+        numbers = statistical_terms = 0
+        for match in _QUANT_UNION.finditer(content):
+            if match.lastgroup == "num":
+                numbers += 1
+            else:
+                statistical_terms += 1
+
         quant_indicators = numbers + statistical_terms * 2
         return min(quant_indicators / 5.0, 1.0)
 
@@ -354,34 +536,52 @@ class SectionRanker:
         if not scored_sections:
             return []
         
-        # Sort by relevance score
-        ranked_sections = sorted(scored_sections, key=lambda x: x["relevance_score"], reverse=True)
-        
-        # Select with diversity
-        selected = []
-        doc_counts = defaultdict(int)
         max_sections = 10
         min_score = 0.3
         max_per_doc = 3
-        
+
+        # A partial top-k selection is enough: the diversity loop never
+        # keeps more than max_sections, and the cushion absorbs sections
+        # skipped by the per-document cap. nlargest preserves the tie
+        # order of a full reverse sort.
+        candidates = max_sections * max_per_doc + 5
+        ranked_sections = heapq.nlargest(candidates, scored_sections,
+                                         key=lambda x: x["relevance_score"])
+
+        selected = self.select_with_diversity(ranked_sections, max_sections, min_score, max_per_doc)
+
+        # If the truncated ranking could not fill the quota, fall back to
+        # the full ordering so deep per-document skips are not lost
+        if len(selected) < max_sections and len(scored_sections) > candidates:
+            ranked_sections = sorted(scored_sections, key=lambda x: x["relevance_score"], reverse=True)
+            selected = self.select_with_diversity(ranked_sections, max_sections, min_score, max_per_doc)
+
+        # Add ranking
+        for i, section in enumerate(selected):
+            section["rank"] = i + 1
+
+        return selected
+
+    def select_with_diversity(self, ranked_sections: List[Dict], max_sections: int,
+                              min_score: float, max_per_doc: int) -> List[Dict]:
+        """Walk sections in rank order, capping how many each document contributes"""
+        selected = []
+        doc_counts = defaultdict(int)
+
         for section in ranked_sections:
             if len(selected) >= max_sections:
                 break
-            
+
             if section["relevance_score"] < min_score:
                 continue
-            
+
             doc_name = section["document"]
             if doc_counts[doc_name] >= max_per_doc:
                 continue
-            
+
             selected.append(section)
             doc_counts[doc_name] += 1
-        
-        # Add ranking
-        for i, section in enumerate(selected):
-            section["rank"] = i + 1
-        
+
         return selected
 
 
@@ -398,7 +598,9 @@ class PersonaDrivenAnalyzer:
         """Process document collection"""
         print("Starting persona-driven document analysis")
         start_time = time.time()
-        
+        # One timestamp for the whole run, shared by success and fallback paths
+        timestamp = datetime.now().isoformat()
+
         try:
             # Load configuration
             config = self.load_configuration(input_dir)
@@ -423,8 +625,11 @@ class PersonaDrivenAnalyzer:
             # Rank and select
             selected_sections = self.section_ranker.rank_and_select(scored_sections)
             
-            # Generate output
-            result = self.generate_output(config, selected_sections)
+            # Generate output (column-oriented when the config opts in)
+            if config.get("compact"):
+                result = self._generate_output_soa(config, selected_sections, timestamp)
+            else:
+                result = self.generate_output(config, selected_sections, timestamp)
             
             # Save result
             output_path = os.path.join(output_dir, "challenge1b_output.json")
@@ -436,20 +641,27 @@ class PersonaDrivenAnalyzer:
             
         except Exception as e:
             print(f"Error in analysis: {e}")
-            fallback = self.create_fallback_output()
+            fallback = self.create_fallback_output(timestamp)
             output_path = os.path.join(output_dir, "challenge1b_output.json")
             self.save_output(fallback, output_path)
 
     def load_configuration(self, input_dir: str) -> Dict:
         """Load processing configuration"""
-        config_files = [f for f in os.listdir(input_dir) if f.endswith('.json')]
-        
+        # One scandir pass serves both the config lookup and the PDF fallback
+        config_files = []
+        pdf_files = []
+        with os.scandir(input_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith('.json'):
+                    config_files.append(entry.name)
+                elif entry.name.endswith('.pdf'):
+                    pdf_files.append(entry.name)
+
         if config_files:
             with open(os.path.join(input_dir, config_files[0]), 'r') as f:
                 return json.load(f)
         else:
             # Default configuration
-            pdf_files = [f for f in os.listdir(input_dir) if f.endswith('.pdf')]
             return {
                 "documents": pdf_files,
                 "persona": "Research Analyst",
@@ -457,109 +669,137 @@ class PersonaDrivenAnalyzer:
             }
 
     def extract_documents(self, document_list: List[str], input_dir: str) -> List[Dict]:
-        """Extract content from documents"""
-        documents = []
-        
-        for doc_name in document_list:
-            doc_path = os.path.join(input_dir, doc_name)
-            if os.path.exists(doc_path) and doc_name.endswith('.pdf'):
-                try:
-                    doc_content = self.extract_pdf_content(doc_path)
-                    documents.append({
-                        "name": doc_name,
-                        "path": doc_path,
-                        "content": doc_content
-                    })
-                    print(f"Extracted content from {doc_name}")
-                except Exception as e:
-                    print(f"Warning: Error extracting {doc_name}: {e}")
-        
-        return documents
+        """Extract content from documents using a pool of worker processes"""
+        # PDF parsing is CPU-bound with no shared state; returns diminish
+        # past a handful of workers, so cap the pool at 4
+        max_workers = min(os.cpu_count() or 1, 4)
+
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = executor.map(partial(_extract_one, input_dir=input_dir), document_list)
+            return [doc for doc in results if doc is not None]
 
     def extract_pdf_content(self, pdf_path: str) -> Dict:
-        """Extract content from PDF"""
+        """Extract content from PDF, splitting big documents across cores"""
         doc = fitz.open(pdf_path)
-        pages_content = []
-        
+
         try:
-            for page_num in range(len(doc)):
-                page = doc[page_num]
-                blocks = page.get_text("dict")
-                page_elements = []
-                
-                for block in blocks.get("blocks", []):
-                    if "lines" in block:
-                        for line in block["lines"]:
-                            line_text = ""
-                            font_sizes = []
-                            style_flags = []
-                            
-                            for span in line["spans"]:
-                                text = span.get("text", "").strip()
-                                if text:
-                                    line_text += text + " "
-                                    font_sizes.append(span.get("size", 12))
-                                    style_flags.append(span.get("flags", 0))
-                            
-                            if line_text.strip():
-                                page_elements.append({
-                                    "text": line_text.strip(),
-                                    "avg_size": statistics.mean(font_sizes) if font_sizes else 12,
-                                    "is_bold": any(flag & 2**4 for flag in style_flags),
-                                    "is_italic": any(flag & 2**6 for flag in style_flags),
-                                    "bbox": line.get("bbox", [0, 0, 0, 0]),
-                                    "page": page_num
-                                })
-                
-                pages_content.append({
-                    "page_num": page_num,
-                    "elements": page_elements
-                })
-        
+            total_pages = len(doc)
+
+            # Only fan out when not already inside a pool worker: the
+            # document-level pool in extract_documents runs this method in
+            # its workers, and nesting pools would launch workers x cores
+            # processes for a collection of large PDFs
+            if total_pages >= _PAGE_PARALLEL_MIN and multiprocessing.parent_process() is None:
+                # Chunk the page range across worker processes; each worker
+                # reopens the file itself
+                workers = os.cpu_count() or 1
+                chunk = max(1, -(-total_pages // workers))
+                starts = list(range(0, total_pages, chunk))
+                ends = [min(start + chunk, total_pages) for start in starts]
+
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    parts = executor.map(partial(_parse_page_range, pdf_path), starts, ends)
+                    pages_content = [page for part in parts for page in part]
+
+                pages_content.sort(key=lambda p: p["page_num"])
+            else:
+                pages_content = [_parse_page(doc[page_num], page_num)
+                                 for page_num in range(total_pages)]
         finally:
             doc.close()
-        
+
         return {
             "pages": pages_content,
             "total_pages": len(pages_content)
         }
 
-    def generate_output(self, config: Dict, selected_sections: List[Dict]) -> Dict:
+    def generate_output(self, config: Dict, selected_sections: List[Dict], timestamp: str) -> Dict:
         """Generate output in required format"""
+        extracted_sections = []
+        sub_section_analysis = []
+
+        # Single pass builds both views of the selected sections
+        for i, section in enumerate(selected_sections):
+            extracted_sections.append({
+                "document": section["document"],
+                "page_number": section["page"],
+                "section_title": section["title"],
+                "importance_rank": section["rank"]
+            })
+            if i < 5:
+                content = section["content"]
+                if len(content) > _REFINED_LIMIT:
+                    content = content[:_REFINED_LIMIT] + _ELLIPSIS
+                sub_section_analysis.append({
+                    "document": section["document"],
+                    "refined_text": content,
+                    "page_number": section["page"]
+                })
+
         return {
             "metadata": {
                 "input_documents": config["documents"],
                 "persona": config["persona"],
                 "job_to_be_done": config["job_to_be_done"],
-                "processing_timestamp": datetime.now().isoformat()
+                "processing_timestamp": timestamp
             },
-            "extracted_sections": [
-                {
-                    "document": section["document"],
-                    "page_number": section["page"],
-                    "section_title": section["title"],
-                    "importance_rank": section["rank"]
-                }
-                for section in selected_sections
-            ],
-            "sub_section_analysis": [
-                {
-                    "document": section["document"],
-                    "refined_text": section["content"][:500] + "..." if len(section["content"]) > 500 else section["content"],
-                    "page_number": section["page"]
-                }
-                for section in selected_sections[:5]
-            ]
+            "extracted_sections": extracted_sections,
+            "sub_section_analysis": sub_section_analysis
         }
 
-    def create_fallback_output(self) -> Dict:
+    def _generate_output_soa(self, config: Dict, selected_sections: List[Dict], timestamp: str) -> Dict:
+        """Generate column-oriented output for compact mode.
+
+        Parallel lists serialize faster and allocate far fewer dicts than
+        the record-per-section layout; consumers opt in via a "compact"
+        flag in the configuration.
+        """
+        documents = []
+        pages = []
+        titles = []
+        ranks = []
+        refined_texts = []
+
+        for i, section in enumerate(selected_sections):
+            documents.append(section["document"])
+            pages.append(section["page"])
+            titles.append(section["title"])
+            ranks.append(section["rank"])
+            if i < 5:
+                content = section["content"]
+                if len(content) > _REFINED_LIMIT:
+                    content = content[:_REFINED_LIMIT] + _ELLIPSIS
+                refined_texts.append(content)
+
+        return {
+            "metadata": {
+                "input_documents": config["documents"],
+                "persona": config["persona"],
+                "job_to_be_done": config["job_to_be_done"],
+                "processing_timestamp": timestamp,
+                "compact": True
+            },
+            "extracted_sections": {
+                "documents": documents,
+                "pages": pages,
+                "titles": titles,
+                "ranks": ranks
+            },
+            "sub_section_analysis": {
+                "documents": documents[:5],
+                "pages": pages[:5],
+                "refined_texts": refined_texts
+            }
+        }
+
+    def create_fallback_output(self, timestamp: str) -> Dict:
         """Create fallback output"""
         return {
             "metadata": {
                 "input_documents": [],
                 "persona": "General User",
                 "job_to_be_done": "Document Analysis",
-                "processing_timestamp": datetime.now().isoformat()
+                "processing_timestamp": timestamp
             },
             "extracted_sections": [],
             "sub_section_analysis": []
@@ -567,8 +807,12 @@ class PersonaDrivenAnalyzer:
 
     def save_output(self, result: Dict, output_path: str):
         """Save result to JSON file"""
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(result, f, indent=2, ensure_ascii=False)
+        if orjson is not None:
+            with open(output_path, 'wb') as f:
+                f.write(orjson.dumps(result, option=orjson.OPT_INDENT_2))
+        else:
+            with open(output_path, 'w', encoding='utf-8') as f:
+                json.dump(result, f, indent=2, ensure_ascii=False)
 
 
 def main():